@@ -7,24 +7,40 @@ Drop this file into src/ and run: python run_tests.py
 
 Usage:
     python run_tests.py          # Run all tests
-    python run_tests.py -q       # Quiet mode (summary only)
+    python run_tests.py -q       # Quiet mode (failures and summary only)
     python run_tests.py -v       # Verbose mode
     python run_tests.py --quick  # Quick tests only (skip slow integration)
+    python run_tests.py -j 0     # Parallel, one worker process per CPU
+
+Set QUIET=1 in the environment for the same effect as -q.
 """
 
 import sys
 import os
+import io
+import json
 import argparse
 import asyncio
 import tempfile
 import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Optional, List, Tuple, Callable
+from functools import partial
+from typing import Optional, List, Sequence, Tuple, Callable, Union
 
 # Ensure imports work
 sys.path.insert(0, str(Path(__file__).parent))
 
+from server.game_engine import (
+    ActionResult, Board, Card, CardAction, CardManager, Dice, DiceResult,
+    Game, Player
+)
+from server.game_engine.cards import CHANCE_CARDS, COMMUNITY_CHEST_CARDS
+from shared.enums import PlayerState, GamePhase, CardType
+from shared.constants import STARTING_MONEY, SALARY_AMOUNT, JAIL_POSITION, JAIL_BAIL
+
 # =============================================================================
 # Test Utilities
 # =============================================================================
@@ -42,36 +58,75 @@ class C:  # Colors
 if not (hasattr(sys.stdout, 'isatty') and sys.stdout.isatty()):
     C.G = C.R = C.Y = C.B = C.C = C.N = C.BOLD = ""
 
-@dataclass
+# Line templates, built once after the TTY check above
+_BAR = "=" * 60
+_OK = f"  {C.G}✓ %s{C.N}\n"
+_FAIL = f"  {C.R}✗ %s{C.N}\n"
+_INFO = f"  {C.Y}→ %s{C.N}\n"
+_HEADER = f"\n{C.BOLD}{C.B}{_BAR}\n %s\n{_BAR}{C.N}\n"
+
+# Test output is collected here and written to stdout once per test.
+# With _show_passes off (quiet runs) only headers, failures and info
+# lines are kept.
+_out = io.StringIO()
+_show_passes = True
+
+# A message is a string or a zero-argument callable returning one; callables
+# are only invoked when the line is actually written.
+LazyMsg = Union[str, Callable[[], str]]
+
+def _emit(template: str, text: LazyMsg) -> None:
+    _out.write(template % (text() if callable(text) else text))
+
+def _take_output() -> str:
+    """Return the buffered output and reset the buffer."""
+    text = _out.getvalue()
+    _out.seek(0)
+    _out.truncate()
+    return text
+
+@dataclass(slots=True)
 class Results:
     passed: int = 0
     failed: int = 0
     
-    def ok(self, cond: bool, msg: str = "") -> bool:
+    def ok(self, cond: bool, msg: LazyMsg = "") -> bool:
         if cond:
             self.passed += 1
         else:
             self.failed += 1
             if msg:
-                print(f"  {C.R}✗ {msg}{C.N}")
+                _emit(_FAIL, msg)
         return cond
     
+    def add_batch(self, checks: List[Tuple[bool, LazyMsg, LazyMsg]]) -> None:
+        """Tally a batch of (condition, ok_msg, fail_msg) checks in one pass."""
+        for cond, ok_msg, fail_msg in checks:
+            if cond:
+                self.passed += 1
+                if _show_passes:
+                    _emit(_OK, ok_msg)
+            else:
+                self.failed += 1
+                _emit(_FAIL, fail_msg)
+    
     def __add__(self, other: "Results") -> "Results":
         return Results(self.passed + other.passed, self.failed + other.failed)
 
 def header(text: str) -> None:
-    print(f"\n{C.BOLD}{C.B}{'='*60}\n {text}\n{'='*60}{C.N}")
+    _emit(_HEADER, text)
 
-def passed(msg: str) -> None:
-    print(f"  {C.G}✓ {msg}{C.N}")
+def passed(msg: LazyMsg) -> None:
+    if _show_passes:
+        _emit(_OK, msg)
 
-def failed(msg: str) -> None:
-    print(f"  {C.R}✗ {msg}{C.N}")
+def failed(msg: LazyMsg) -> None:
+    _emit(_FAIL, msg)
 
 def info(msg: str) -> None:
-    print(f"  {C.Y}→ {msg}{C.N}")
+    _emit(_INFO, msg)
 
-def check(r: Results, cond: bool, ok_msg: str, fail_msg: str) -> None:
+def check(r: Results, cond: bool, ok_msg: LazyMsg, fail_msg: LazyMsg) -> None:
     if r.ok(cond, fail_msg):
         passed(ok_msg)
 
@@ -79,9 +134,12 @@ def check(r: Results, cond: bool, ok_msg: str, fail_msg: str) -> None:
 # Game Setup Helpers
 # =============================================================================
 
+# Mediterranean and Baltic: the cheapest monopoly, used wherever a test
+# just needs one to build on
+BROWN = (1, 3)
+
 def make_game(n_players: int = 2, start: bool = True):
     """Create a test game with players."""
-    from server.game_engine import Game
     game = Game(name="Test")
     for name in ["Alice", "Bob", "Charlie", "Diana"][:n_players]:
         game.add_player(name)
@@ -89,21 +147,35 @@ def make_game(n_players: int = 2, start: bool = True):
         game.start_game()
     return game
 
-def give_monopoly(game, player, positions: List[int]) -> None:
+def give_monopoly(game, player, positions: Sequence[int]) -> None:
     """Give player ownership of properties at positions."""
-    for pos in positions:
-        prop = game.board.get_property(pos)
-        if prop:
-            prop.owner_id = player.id
-            if pos not in player.properties:
-                player.add_property(pos)
+    game.board.transfer_properties(positions, player.id)
+    player.add_properties(pos for pos in positions if pos in game.board.properties)
+
+def reset_ownership(game) -> None:
+    """Return every property to the bank and clear player holdings."""
+    game.board.reset()
+    for player in game.players.values():
+        player.properties.clear()
 
 def other_player(game, player):
     """Get a different player from the game."""
-    for pid in game.player_order:
-        if pid != player.id:
-            return game.players[pid]
-    return None
+    return next(
+        (game.players[pid] for pid in game.player_order if pid != player.id), None
+    )
+
+class MockDice:
+    """Stand-in for Dice that returns a fixed sequence of rolls."""
+    __slots__ = ("_rolls", "_i")
+    
+    def __init__(self, rolls):
+        self._rolls = tuple(rolls)
+        self._i = 0
+    
+    def roll(self):
+        result = self._rolls[self._i]
+        self._i += 1
+        return result
 
 # =============================================================================
 # Unit Tests - Game Engine Core
@@ -113,7 +185,6 @@ def test_dice() -> Results:
     """Test dice mechanics."""
     header("DICE TESTS")
     r = Results()
-    from server.game_engine import Dice
     
     dice = Dice(seed=42)
     roll = dice.roll()
@@ -141,9 +212,6 @@ def test_player() -> Results:
     """Test player mechanics."""
     header("PLAYER TESTS")
     r = Results()
-    from server.game_engine import Player
-    from shared.enums import PlayerState
-    from shared.constants import STARTING_MONEY, SALARY_AMOUNT, JAIL_POSITION
     
     p = Player(name="Test")
     check(r, p.money == STARTING_MONEY, f"Starting money: ${p.money}", "Wrong starting money")
@@ -177,7 +245,6 @@ def test_board() -> Results:
     """Test board and property mechanics."""
     header("BOARD TESTS")
     r = Results()
-    from server.game_engine import Board
     
     board = Board()
     check(r, len(board.properties) == 28, f"28 properties: {len(board.properties)}", "Wrong property count")
@@ -222,8 +289,6 @@ def test_cards() -> Results:
     """Test card mechanics."""
     header("CARD TESTS")
     r = Results()
-    from server.game_engine import CardManager
-    from server.game_engine.cards import CHANCE_CARDS, COMMUNITY_CHEST_CARDS
     
     cards = CardManager()
     
@@ -234,21 +299,66 @@ def test_cards() -> Results:
     check(r, len(cc_texts) > 5, f"CC variety: {len(cc_texts)} unique", "Low CC variety")
     
     # Card counts
-    check(r, len(CHANCE_CARDS) == 16, "16 Chance cards", f"Wrong count: {len(CHANCE_CARDS)}")
-    check(r, len(COMMUNITY_CHEST_CARDS) == 16, "16 CC cards", f"Wrong count: {len(COMMUNITY_CHEST_CARDS)}")
+    r.add_batch([
+        (len(CHANCE_CARDS) == 16, "16 Chance cards", f"Wrong count: {len(CHANCE_CARDS)}"),
+        (len(COMMUNITY_CHEST_CARDS) == 16, "16 CC cards", f"Wrong count: {len(COMMUNITY_CHEST_CARDS)}"),
+    ])
     
     # Reshuffle
     cards.reset()
     for _ in range(50):
         cards.draw_chance()
     check(r, True, "Deck reshuffles", "Reshuffle failed")
+    
+    # Player-to-player payments settle as one delta on the drawing player
+    game = make_game(3)
+    player = game.current_player
+    others = game.opponents
+    
+    card = Card(CardType.CHANCE, "Collect $10 from each player", CardAction.COLLECT_FROM_PLAYERS, value=10)
+    game._execute_card(player, card, None)
+    check(r, player.money == STARTING_MONEY + 20, f"Collected ${player.money - STARTING_MONEY}",
+          f"Wrong total: ${player.money}")
+    check(r, all(p.money == STARTING_MONEY - 10 for p in others), "Each opponent paid $10",
+          lambda: f"Opponent balances: {[p.money for p in others]}")
+    
+    card = Card(CardType.CHANCE, "Pay each player $10", CardAction.PAY_TO_PLAYERS, value=10)
+    game._execute_card(player, card, None)
+    check(r, player.money == STARTING_MONEY, "Paid $20", f"Wrong total: ${player.money}")
+    check(r, all(p.money == STARTING_MONEY for p in others), "Each opponent received $10",
+          lambda: f"Opponent balances: {[p.money for p in others]}")
+    
+    # Repairs: $25 per house, $100 per hotel
+    give_monopoly(game, player, BROWN)
+    game.board.get_property(1).houses = 3
+    game.board.get_property(3).has_hotel = True
+    card = Card(CardType.CHANCE, "General repairs", CardAction.REPAIRS, per_house=25, per_hotel=100)
+    game._execute_card(player, card, None)
+    check(r, player.money == STARTING_MONEY - 175, "Repairs cost $175 (3 houses + 1 hotel)",
+          f"Wrong repair cost: ${STARTING_MONEY - player.money}")
+    
+    # Advancing past GO by card pays salary; moving back never does
+    player.money = STARTING_MONEY
+    player.position = 36
+    card = Card(CardType.CHANCE, "Advance to Reading Railroad", CardAction.MOVE_TO, value=5)
+    game._execute_card(player, card, None)
+    check(r, player.position == 5 and player.money == STARTING_MONEY + SALARY_AMOUNT,
+          "Card move 36 -> 5 collects GO salary",
+          f"Position {player.position}, money ${player.money}")
+    
+    player.money = STARTING_MONEY
+    player.position = 2
+    card = Card(CardType.CHANCE, "Go back 3 spaces", CardAction.MOVE_BACK, value=3)
+    game._execute_card(player, card, None)
+    check(r, player.position == 39 and player.money == STARTING_MONEY,
+          "Card move back 2 -> 39 skips GO salary",
+          f"Position {player.position}, money ${player.money}")
     return r
 
 def test_game_flow() -> Results:
     """Test game flow and turn management."""
     header("GAME FLOW TESTS")
     r = Results()
-    from shared.enums import GamePhase
     
     game = make_game(2, start=False)
     check(r, game.phase == GamePhase.WAITING, "Starts in WAITING", f"Wrong phase: {game.phase}")
@@ -275,16 +385,22 @@ def test_game_flow() -> Results:
     check(r, not ok, f"Can't add after start: {msg}", "Should block late join")
     
     # Wrong player can't roll
-    other_id = [pid for pid in game.player_order if pid != current.id][0]
+    other_id = other_player(game, current).id
     ok, msg, _ = game.roll_dice(other_id)
     check(r, not ok, f"Wrong player blocked: {msg}", "Should block wrong player")
+    
+    # Unknown player IDs are rejected everywhere
+    for action in (game.roll_dice, game.buy_property, game.end_turn, game.pay_bail,
+                   game.use_jail_card, game.remove_player, game.declare_bankruptcy):
+        ok = action("no-such-player")[0]
+        check(r, not ok, f"{action.__name__} rejects unknown player",
+              f"{action.__name__} accepted unknown player")
     return r
 
 def test_property_actions() -> Results:
     """Test property purchase, building, mortgage."""
     header("PROPERTY ACTIONS TESTS")
     r = Results()
-    from shared.enums import GamePhase
     
     # Buy property
     game = make_game(2)
@@ -310,7 +426,7 @@ def test_property_actions() -> Results:
     check(r, not ok, f"No build without monopoly: {msg}", "Should require monopoly")
     
     # Build with monopoly
-    give_monopoly(game2, p, [1, 3])
+    give_monopoly(game2, p, BROWN)
     ok, msg = game2.build_house(p.id, 1)
     check(r, ok, f"Built house: {msg}", f"Build failed: {msg}")
     
@@ -329,8 +445,6 @@ def test_jail() -> Results:
     """Test jail mechanics."""
     header("JAIL TESTS")
     r = Results()
-    from shared.enums import PlayerState, GamePhase
-    from shared.constants import JAIL_POSITION, JAIL_BAIL
     
     game = make_game(2)
     player = game.current_player
@@ -359,13 +473,23 @@ def test_jail() -> Results:
     check(r, ok, "Used jail card", f"Card failed: {msg}")
     check(r, p2.state == PlayerState.ACTIVE, "Released by card", "Not released")
     check(r, p2.jail_cards == 0, "Card consumed", "Card not consumed")
+    
+    # Rolling doubles gets you out
+    game3 = make_game(2)
+    p3 = game3.current_player
+    p3.send_to_jail()
+    game3.dice = MockDice([DiceResult.of(3, 3)])
+    game3.phase = GamePhase.PRE_ROLL
+    
+    ok, msg, _ = game3.roll_dice(p3.id)
+    check(r, ok and p3.state == PlayerState.ACTIVE, "Doubles release from jail", f"Still jailed: {msg}")
+    check(r, p3.position == JAIL_POSITION + 6, f"Moved to {p3.position}", f"Wrong position: {p3.position}")
     return r
 
 def test_bankruptcy() -> Results:
     """Test bankruptcy mechanics."""
     header("BANKRUPTCY TESTS")
     r = Results()
-    from shared.enums import PlayerState
     
     game = make_game(2)
     p1 = game.current_player
@@ -383,7 +507,7 @@ def test_bankruptcy() -> Results:
     alice = game2.current_player
     bob = other_player(game2, alice)
     
-    give_monopoly(game2, alice, [1, 3])
+    give_monopoly(game2, alice, BROWN)
     alice.money = 0
     bob_money = bob.money
     
@@ -400,56 +524,57 @@ def test_rent() -> Results:
     game = make_game(2)
     alice = game.current_player
     bob = other_player(game, alice)
+    board = game.board
+    props = board.properties
     
     # Base rent
-    prop = game.board.get_property(1)  # Mediterranean
+    prop = props[1]  # Mediterranean
     prop.owner_id = alice.id
-    rent = game.board.calculate_rent(1, landing_player_id=bob.id)
-    check(r, rent == 2, f"Base rent $2", f"Wrong: ${rent}")
+    rent = board.calculate_rent(1, landing_player_id=bob.id)
+    check(r, rent == 2, "Base rent $2", f"Wrong: ${rent}")
     
     # Monopoly rent
-    give_monopoly(game, alice, [1, 3])
-    rent = game.board.calculate_rent(1, landing_player_id=bob.id)
-    check(r, rent == 4, f"Monopoly rent $4", f"Wrong: ${rent}")
+    give_monopoly(game, alice, BROWN)
+    rent = board.calculate_rent(1, landing_player_id=bob.id)
+    check(r, rent == 4, "Monopoly rent $4", f"Wrong: ${rent}")
     
     # Railroad rent
-    game.board.reset()
-    rr = game.board.get_property(5)  # Reading RR
+    reset_ownership(game)
+    rr = props[5]  # Reading RR
     rr.owner_id = alice.id
     rent = rr.calculate_rent(same_group_owned=1)
-    check(r, rent == 25, f"1 RR rent $25", f"Wrong: ${rent}")
+    check(r, rent == 25, "1 RR rent $25", f"Wrong: ${rent}")
     
-    for pos in [5, 15, 25, 35]:
-        game.board.get_property(pos).owner_id = alice.id
-    rent = game.board.get_property(5).calculate_rent(same_group_owned=4)
-    check(r, rent == 200, f"4 RR rent $200", f"Wrong: ${rent}")
+    board.transfer_properties((5, 15, 25, 35), alice.id)
+    rent = props[5].calculate_rent(same_group_owned=4)
+    check(r, rent == 200, "4 RR rent $200", f"Wrong: ${rent}")
     
     # Utility rent
-    game.board.reset()
-    elec = game.board.get_property(12)
+    reset_ownership(game)
+    elec = props[12]
     elec.owner_id = alice.id
     rent = elec.calculate_rent(dice_roll=7, same_group_owned=1)
-    check(r, rent == 28, f"1 util rent 4×7=$28", f"Wrong: ${rent}")
+    check(r, rent == 28, "1 util rent 4×7=$28", f"Wrong: ${rent}")
     
-    game.board.get_property(28).owner_id = alice.id
+    props[28].owner_id = alice.id
     rent = elec.calculate_rent(dice_roll=7, same_group_owned=2)
-    check(r, rent == 70, f"2 util rent 10×7=$70", f"Wrong: ${rent}")
+    check(r, rent == 70, "2 util rent 10×7=$70", f"Wrong: ${rent}")
     return r
 
 def test_trading() -> Results:
     """Test trade validation."""
     header("TRADING TESTS")
     r = Results()
-    from server.game_engine import ActionResult
     
     game = make_game(2)
     alice = game.current_player
     bob = other_player(game, alice)
     
     # Give properties
-    game.board.get_property(1).owner_id = alice.id
+    props = game.board.properties
+    props[1].owner_id = alice.id
     alice.add_property(1)
-    game.board.get_property(3).owner_id = bob.id
+    props[3].owner_id = bob.id
     bob.add_property(3)
     
     # Valid trade
@@ -462,7 +587,7 @@ def test_trading() -> Results:
           "Can't trade unowned", "Should fail")
     
     # Can't trade with buildings
-    game.board.get_property(1).houses = 1
+    props[1].houses = 1
     v = game.rules.validate_trade(alice, bob, 0, 0, [1], [], 0, 0)
     check(r, not v.valid and v.result == ActionResult.HAS_BUILDINGS,
           "Can't trade with buildings", "Should fail")
@@ -476,35 +601,35 @@ def test_serialization() -> Results:
     """Test save/load game state."""
     header("SERIALIZATION TESTS")
     r = Results()
-    from server.game_engine import Game
-    from server.game_engine.dice import DiceResult
     
     game = make_game(3)
     game.turn_number = 15
-    game.last_dice_roll = DiceResult(die1=4, die2=5)
+    game.last_dice_roll = DiceResult.of(4, 5)
     
     alice = game.current_player
     alice.money = 800
     alice.position = 24
-    give_monopoly(game, alice, [1, 3])
+    give_monopoly(game, alice, BROWN)
     game.board.get_property(1).houses = 2
     
     # Save
     data = game.to_dict()
-    check(r, data["turn_number"] == 15, "Turn saved", "Turn not saved")
-    check(r, data["last_dice_roll"] == [4, 5], "Dice saved", "Dice not saved")
+    r.add_batch([
+        (data["turn_number"] == 15, "Turn saved", "Turn not saved"),
+        (data["last_dice_roll"] == [4, 5], "Dice saved", "Dice not saved"),
+    ])
     
     # Load
     loaded = Game.from_dict(data)
-    check(r, loaded.id == game.id, "ID preserved", "ID changed")
-    check(r, loaded.turn_number == 15, "Turn restored", "Turn wrong")
-    
     loaded_alice = loaded.players.get(alice.id)
-    check(r, loaded_alice and loaded_alice.money == 800, "Money restored", "Money wrong")
-    check(r, loaded_alice and loaded_alice.position == 24, "Position restored", "Position wrong")
-    
     loaded_prop = loaded.board.get_property(1)
-    check(r, loaded_prop and loaded_prop.houses == 2, "Houses restored", "Houses wrong")
+    r.add_batch([
+        (loaded.id == game.id, "ID preserved", "ID changed"),
+        (loaded.turn_number == 15, "Turn restored", "Turn wrong"),
+        (loaded_alice and loaded_alice.money == 800, "Money restored", "Money wrong"),
+        (loaded_alice and loaded_alice.position == 24, "Position restored", "Position wrong"),
+        (loaded_prop and loaded_prop.houses == 2, "Houses restored", "Houses wrong"),
+    ])
     return r
 
 # =============================================================================
@@ -522,9 +647,6 @@ def test_network() -> Results:
         info("Skipping network tests (websockets not installed)")
         return r
     
-    import json
-    from unittest.mock import MagicMock
-    
     class MockWS:
         def __init__(self, id):
             self.id = id
@@ -544,7 +666,6 @@ def test_network() -> Results:
         from server.network.game_manager import GameManager
         from server.persistence import init_database, GameRepository
         from shared.protocol import Message, GameSettings
-        from shared.enums import MessageType
         
         # Connection manager tests
         cm = ConnectionManager()
@@ -623,7 +744,6 @@ def test_persistence() -> Results:
         check(r, len(games) >= 1, f"Listed {len(games)} game(s)", "List failed")
         
         # Load game state
-        import json
         loaded = repo.get_latest_game_state(game.id)
         check(r, loaded is not None, "State loaded", "Load failed")
         state_data = json.loads(loaded.state_json) if loaded else {}
@@ -655,12 +775,8 @@ def test_integration() -> Results:
         info("Skipping integration tests (websockets not installed)")
         return r
     
-    import json
-    import uuid
-    
     async def run_test():
         from server.network.server import MonopolyServer
-        from shared.enums import MessageType, GamePhase
         
         with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
             db_path = f.name
@@ -732,92 +848,107 @@ def test_integration() -> Results:
 # Main Runner
 # =============================================================================
 
-def run_all(quick: bool = False, verbose: bool = True) -> Results:
-    """Run all tests."""
+# Unit tests (always run)
+UNIT_TESTS: Tuple[Callable[[], Results], ...] = (
+    test_dice,
+    test_player,
+    test_board,
+    test_cards,
+    test_game_flow,
+    test_property_actions,
+    test_jail,
+    test_bankruptcy,
+    test_rent,
+    test_trading,
+    test_serialization,
+)
+
+# Network/persistence/integration (skipped in quick mode)
+SLOW_TESTS: Tuple[Callable[[], Results], ...] = (
+    test_network,
+    test_persistence,
+    test_integration,
+)
+
+ALL_TESTS = UNIT_TESTS + SLOW_TESTS
+
+def _run_one(
+    test: Callable[[], Results],
+    show_passes: bool = True
+) -> Tuple[Results, str]:
+    """Run a single test, returning its results and buffered output."""
+    global _show_passes
+    _show_passes = show_passes
+    try:
+        result = test()
+    except Exception as e:
+        failed(f"{test.__name__} raised: {e}")
+        result = Results(failed=1)
+    return result, _take_output()
+
+def _report(outcomes, verbose: bool) -> Results:
+    """
+    Tally outcomes as they arrive, writing each test's output in suite order.
+    Quiet runs only write the output of tests with failures.
+    """
     total = Results()
-    
-    # Unit tests (always run)
-    tests = [
-        test_dice,
-        test_player,
-        test_board,
-        test_cards,
-        test_game_flow,
-        test_property_actions,
-        test_jail,
-        test_bankruptcy,
-        test_rent,
-        test_trading,
-        test_serialization,
-    ]
-    
-    for test in tests:
-        try:
-            if verbose:
-                result = test()
-            else:
-                import io
-                from contextlib import redirect_stdout
-                with redirect_stdout(io.StringIO()):
-                    result = test()
-            total = total + result
-        except Exception as e:
-            failed(f"{test.__name__} raised: {e}")
-            total.failed += 1
-    
-    # Network/persistence/integration (skip if quick mode)
-    if not quick:
-        for test in [test_network, test_persistence, test_integration]:
-            try:
-                if verbose:
-                    result = test()
-                else:
-                    import io
-                    from contextlib import redirect_stdout
-                    with redirect_stdout(io.StringIO()):
-                        result = test()
-                total = total + result
-            except Exception as e:
-                failed(f"{test.__name__} raised: {e}")
-                total.failed += 1
-    
+    for result, output in outcomes:
+        total = total + result
+        if verbose or result.failed:
+            sys.stdout.write(output)
+            sys.stdout.flush()
     return total
 
+def run_all(quick: bool = False, verbose: bool = True, jobs: int = 1) -> Results:
+    """Run all tests, optionally spread across `jobs` worker processes."""
+    tests = UNIT_TESTS if quick else ALL_TESTS
+    # Quiet runs still report failures and exceptions, just not passes
+    run = partial(_run_one, show_passes=verbose)
+    
+    if jobs > 1:
+        # No more workers than tests; report while later tests still run
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tests))) as pool:
+            return _report(pool.map(run, tests), verbose)
+    return _report(map(run, tests), verbose)
+
+def _env_flag(name: str) -> bool:
+    """True if environment variable `name` is set to 1/true/yes/on."""
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Monopoly Test Suite")
     parser.add_argument("-q", "--quiet", action="store_true", help="Quiet mode")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose mode (default)")
     parser.add_argument("--quick", action="store_true", help="Quick mode (unit tests only)")
+    parser.add_argument("-j", "--jobs", type=int, default=1, metavar="N",
+                        help="Run tests in N worker processes (0 = one per CPU)")
     args = parser.parse_args()
     
-    verbose = not args.quiet
+    verbose = not (args.quiet or _env_flag("QUIET"))
     
-    print(f"\n{C.BOLD}{C.C}{'='*60}")
-    print(f" MONOPOLY TEST SUITE")
-    print(f"{'='*60}{C.N}")
+    sys.stdout.write(f"\n{C.BOLD}{C.C}{_BAR}\n MONOPOLY TEST SUITE\n{_BAR}{C.N}\n")
+    sys.stdout.flush()
     
     start = time.time()
-    results = run_all(quick=args.quick, verbose=verbose)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    results = run_all(quick=args.quick, verbose=verbose, jobs=jobs)
     elapsed = time.time() - start
     
-    print(f"\n{C.BOLD}{C.C}{'='*60}")
-    print(f" RESULTS")
-    print(f"{'='*60}{C.N}")
-    print(f"\n  Total:  {results.passed + results.failed}")
-    print(f"  {C.G}Passed: {results.passed}{C.N}")
-    print(f"  {C.R}Failed: {results.failed}{C.N}")
-    print(f"  Time:   {elapsed:.2f}s")
-    
     if results.failed == 0:
-        print(f"\n{C.G}{C.BOLD}{'='*60}")
-        print(f" ALL TESTS PASSED ✓")
-        print(f"{'='*60}{C.N}")
-        return 0
+        verdict = f"\n{C.G}{C.BOLD}{_BAR}\n ALL TESTS PASSED ✓\n{_BAR}{C.N}"
     else:
-        print(f"\n{C.R}{C.BOLD}{'='*60}")
-        print(f" SOME TESTS FAILED ✗")
-        print(f"{'='*60}{C.N}")
-        return 1
+        verdict = f"\n{C.R}{C.BOLD}{_BAR}\n SOME TESTS FAILED ✗\n{_BAR}{C.N}"
+    
+    # Summary goes out in a single write
+    sys.stdout.write(
+        f"\n{C.BOLD}{C.C}{_BAR}\n RESULTS\n{_BAR}{C.N}\n"
+        f"\n  Total:  {results.passed + results.failed}\n"
+        f"  {C.G}Passed: {results.passed}{C.N}\n"
+        f"  {C.R}Failed: {results.failed}{C.N}\n"
+        f"  Time:   {elapsed:.2f}s\n"
+        f"{verdict}\n"
+    )
+    return 0 if results.failed == 0 else 1
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -2,11 +2,7 @@
 Board representation and property management.
 """
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
-
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from shared.constants import (
     BOARD_SIZE, BOARD_SPACES, PROPERTY_GROUPS,
@@ -15,6 +11,28 @@ from shared.constants import (
 from shared.enums import SpaceType, PropertyGroup
 
 
+# Space type of every board position, resolved once at import
+SPACE_TYPES: Dict[int, SpaceType] = {
+    position: SpaceType(space["type"])
+    for position, space in BOARD_SPACES.items()
+}
+
+
+def _group_positions() -> Dict[str, Tuple[int, ...]]:
+    """Board positions of each property group, in board order."""
+    groups: Dict[str, List[int]] = {}
+    for position, space in BOARD_SPACES.items():
+        if space["type"] in ("PROPERTY", "RAILROAD", "UTILITY"):
+            groups.setdefault(space["group"], []).append(position)
+    return {group: tuple(positions) for group, positions in groups.items()}
+
+
+GROUP_POSITIONS = _group_positions()
+
+# Groups that never form a monopoly: their rent scales with the count owned
+NO_MONOPOLY_GROUPS = frozenset({"RAILROAD", "UTILITY"})
+
+
 @dataclass
 class PokemonData:
     """Pokemon data associated with a property."""
@@ -84,7 +102,7 @@ class ItemData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     """Represents a purchasable property on the board."""
     
@@ -162,27 +180,43 @@ class Property:
         if self.is_mortgaged or not self.is_owned:
             return 0
         
-        if self.space_type == SpaceType.PROPERTY:
-            if self.has_hotel:
-                return self.rents[5]
-            elif self.houses > 0:
-                return self.rents[self.houses]
-            elif has_monopoly:
-                return self.rents[0] * 2  # Double rent for monopoly
-            else:
-                return self.rents[0]
-        
-        elif self.space_type == SpaceType.RAILROAD:
-            # Rent based on number of railroads owned
-            if 1 <= same_group_owned <= 4:
-                return self.rents[same_group_owned - 1]
+        rent = self._RENT_BY_TYPE.get(self.space_type)
+        if rent is None:
+            return 0
+        return rent(self, dice_roll, same_group_owned, has_monopoly)
+    
+    def _rent_property(
+        self, dice_roll: int, same_group_owned: int, has_monopoly: bool
+    ) -> int:
+        if self.has_hotel:
+            return self.rents[5]
+        elif self.houses > 0:
+            return self.rents[self.houses]
+        elif has_monopoly:
+            return self.rents[0] * 2  # Double rent for monopoly
+        else:
             return self.rents[0]
-        
-        elif self.space_type == SpaceType.UTILITY:
-            multiplier = UTILITY_MULTIPLIERS.get(same_group_owned, 4)
-            return dice_roll * multiplier
-        
-        return 0
+    
+    def _rent_railroad(
+        self, dice_roll: int, same_group_owned: int, has_monopoly: bool
+    ) -> int:
+        # Rent based on number of railroads owned
+        if 1 <= same_group_owned <= 4:
+            return self.rents[same_group_owned - 1]
+        return self.rents[0]
+    
+    def _rent_utility(
+        self, dice_roll: int, same_group_owned: int, has_monopoly: bool
+    ) -> int:
+        multiplier = UTILITY_MULTIPLIERS.get(same_group_owned, 4)
+        return dice_roll * multiplier
+    
+    # Space type -> rent rule; other space types charge no rent
+    _RENT_BY_TYPE = {
+        SpaceType.PROPERTY: _rent_property,
+        SpaceType.RAILROAD: _rent_railroad,
+        SpaceType.UTILITY: _rent_utility,
+    }
     
     def build_house(self) -> bool:
         """
@@ -361,8 +395,7 @@ class Board:
     
     def get_space_type(self, position: int) -> SpaceType:
         """Get the type of space at a position."""
-        space = self.get_space(position)
-        return SpaceType(space.get("type", "GO"))
+        return SPACE_TYPES.get(position, SpaceType.GO)
     
     def get_property(self, position: int) -> Property | None:
         """Get property at position, if it exists."""
@@ -370,12 +403,12 @@ class Board:
     
     def get_property_owner(self, position: int) -> str | None:
         """Get owner ID of property at position."""
-        prop = self.get_property(position)
+        prop = self.properties.get(position)
         return prop.owner_id if prop else None
     
     def is_property_available(self, position: int) -> bool:
         """Check if property at position can be purchased."""
-        prop = self.get_property(position)
+        prop = self.properties.get(position)
         return prop is not None and not prop.is_owned
     
     def get_player_properties(self, player_id: str) -> List[Property]:
@@ -387,15 +420,13 @@ class Board:
     
     def get_group_properties(self, group: str) -> List[Property]:
         """Get all properties in a color group."""
-        return [
-            prop for prop in self.properties.values()
-            if prop.group == group
-        ]
+        properties = self.properties
+        return [properties[pos] for pos in GROUP_POSITIONS.get(group, ())]
     
     def player_has_monopoly(self, player_id: str, group: str) -> bool:
         """Check if player owns all properties in a group."""
-        if group in ("RAILROAD", "UTILITY"):
-            return False  # No monopoly for these
+        if group in NO_MONOPOLY_GROUPS:
+            return False
         
         group_properties = self.get_group_properties(group)
         if not group_properties:
@@ -410,6 +441,24 @@ class Board:
             if prop.owner_id == player_id
         )
     
+    def count_buildings(self, positions: Iterable[int]) -> Tuple[int, int]:
+        """
+        Count houses and hotels across the given property positions.
+        Positions that are not properties are skipped.
+        
+        Returns:
+            Tuple of (houses, hotels)
+        """
+        get_property = self.properties.get
+        houses = hotels = 0
+        for pos in positions:
+            prop = get_property(pos)
+            if prop is None:
+                continue
+            houses += prop.houses
+            hotels += prop.has_hotel
+        return houses, hotels
+    
     def can_build_house(self, position: int, player_id: str) -> bool:
         """
         Check if a house can be built on a property.
@@ -421,7 +470,7 @@ class Board:
         - Even building rule (can't be more than 1 house ahead of others in group)
         - Less than 4 houses
         """
-        prop = self.get_property(position)
+        prop = self.properties.get(position)
         if not prop or prop.owner_id != player_id:
             return False
         
@@ -449,7 +498,7 @@ class Board:
         - Property has 4 houses
         - Even building rule
         """
-        prop = self.get_property(position)
+        prop = self.properties.get(position)
         if not prop or prop.owner_id != player_id:
             return False
         
@@ -483,17 +532,22 @@ class Board:
         Returns:
             Rent amount owed
         """
-        prop = self.get_property(position)
+        prop = self.properties.get(position)
         if not prop or not prop.is_owned:
             return 0
         
-        # No rent if landing on own property
-        if prop.owner_id == landing_player_id:
+        # No rent if landing on own property, or on a mortgaged one
+        # (checked here so neither pays for the group scan below)
+        if prop.owner_id == landing_player_id or prop.is_mortgaged:
             return 0
         
-        # Calculate based on property type
+        # Calculate based on property type. One pass over the group gives
+        # both the owned count and (for color groups) the monopoly flag.
         same_group_owned = self.count_group_owned(prop.owner_id, prop.group)
-        has_monopoly = self.player_has_monopoly(prop.owner_id, prop.group)
+        has_monopoly = (
+            prop.group not in NO_MONOPOLY_GROUPS
+            and same_group_owned == len(GROUP_POSITIONS.get(prop.group, ()))
+        )
         
         return prop.calculate_rent(
             dice_roll=dice_roll,
@@ -516,13 +570,25 @@ class Board:
         Returns:
             True if successful
         """
-        prop = self.get_property(position)
+        prop = self.properties.get(position)
         if not prop:
             return False
         
         prop.owner_id = new_owner_id
         return True
     
+    def transfer_properties(
+        self, 
+        positions: Iterable[int], 
+        new_owner_id: str | None
+    ) -> None:
+        """Transfer ownership of every property at positions in one pass."""
+        properties = self.properties
+        for position in positions:
+            prop = properties.get(position)
+            if prop:
+                prop.owner_id = new_owner_id
+    
     def reset(self) -> None:
         """Reset board to initial state."""
         for prop in self.properties.values():
@@ -7,10 +7,6 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import List, Optional, Dict
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from shared.enums import CardType
 
 
@@ -28,7 +24,7 @@ class CardAction(Enum):
     REPAIRS = auto()            # Pay per house/hotel
 
 
-@dataclass
+@dataclass(frozen=True)
 class Card:
     """Represents a Chance or Community Chest card."""
     
@@ -333,28 +329,10 @@ class CardDeck:
     
     def reset(self) -> None:
         """Reset deck to initial shuffled state."""
-        if self.card_type == CardType.CHANCE:
-            self.cards = [Card(
-                card_type=c.card_type,
-                text_template=c.text_template,
-                action=c.action,
-                value=c.value,
-                per_house=c.per_house,
-                per_hotel=c.per_hotel,
-                keep=c.keep
-            ) for c in CHANCE_CARDS]
-        else:
-            self.cards = [Card(
-                card_type=c.card_type,
-                text_template=c.text_template,
-                action=c.action,
-                value=c.value,
-                per_house=c.per_house,
-                per_hotel=c.per_hotel,
-                keep=c.keep
-            ) for c in COMMUNITY_CHEST_CARDS]
-        
-        random.shuffle(self.cards)
+        template = CHANCE_CARDS if self.card_type == CardType.CHANCE else COMMUNITY_CHEST_CARDS
+        # Card is frozen, so the deck can share the template instances;
+        # sample() returns a fresh shuffled list in one call
+        self.cards = random.sample(template, len(template))
         self.discard = []
         self._initialized = True
     
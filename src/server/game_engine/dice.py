@@ -6,12 +6,20 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class DiceResult:
-    """Result of rolling two dice."""
+    """Result of rolling two dice. Immutable, so instances can be shared."""
     die1: int
     die2: int
     
+    @classmethod
+    def of(cls, die1: int, die2: int) -> "DiceResult":
+        """Get the shared instance for a pair of dice values."""
+        result = _INTERNED.get((die1, die2))
+        if result is None:
+            result = cls(die1=die1, die2=die2)
+        return result
+    
     @property
     def total(self) -> int:
         """Sum of both dice."""
@@ -27,6 +35,14 @@ class DiceResult:
         return [self.die1, self.die2]
 
 
+# All 36 possible rolls, built once and shared
+_INTERNED = {
+    (die1, die2): DiceResult(die1=die1, die2=die2)
+    for die1 in range(1, 7)
+    for die2 in range(1, 7)
+}
+
+
 class Dice:
     """Handles all dice rolling for the game."""
     
@@ -48,7 +64,7 @@ class Dice:
         """
         die1 = self._random.randint(1, 6)
         die2 = self._random.randint(1, 6)
-        return DiceResult(die1=die1, die2=die2)
+        return _INTERNED[(die1, die2)]
     
     def set_seed(self, seed: int) -> None:
         """Set random seed for reproducible results."""
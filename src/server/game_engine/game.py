@@ -2,15 +2,12 @@
 Main game orchestration - ties all components together.
 """
 import logging
+import random
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Callable
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 logger = logging.getLogger(__name__)
 
 from shared.constants import (
@@ -64,6 +61,10 @@ class Game:
     player_order: List[str] = field(default_factory=list)
     current_player_index: int = 0
     
+    # Active players other than the current one, refreshed whenever the
+    # turn, the roster or the set of active players changes
+    _opponents: Tuple[Player, ...] = field(default_factory=tuple, init=False, repr=False, compare=False)
+    
     # Game state
     phase: GamePhase = GamePhase.WAITING
     turn_number: int = 0
@@ -100,6 +101,11 @@ class Game:
             if p.state != PlayerState.BANKRUPT
         ]
     
+    @property
+    def opponents(self) -> Tuple[Player, ...]:
+        """Get all non-bankrupt players other than the current player."""
+        return self._opponents
+    
     @property
     def is_game_over(self) -> bool:
         """Check if game is over (one player left)."""
@@ -111,6 +117,17 @@ class Game:
         self.events.append(event)
         return event
     
+    def _refresh_opponents(self) -> None:
+        """Recompute the cached list of the current player's opponents."""
+        current = self.current_player
+        current_id = current.id if current else None
+        self._opponents = tuple(
+            self.players[pid] for pid in self.player_order
+            if pid != current_id
+            and pid in self.players
+            and self.players[pid].state != PlayerState.BANKRUPT
+        )
+    
     def _advance_turn(self) -> None:
         """Move to next player's turn."""
         if not self.player_order:
@@ -131,6 +148,7 @@ class Game:
         
         self.turn_number += 1
         self.phase = GamePhase.PRE_ROLL
+        self._refresh_opponents()
         
         if self.current_player:
             self.current_player.reset_turn()
@@ -165,6 +183,7 @@ class Game:
         
         self.players[player.id] = player
         self.player_order.append(player.id)
+        self._refresh_opponents()
         
         self._log_event("player_joined", {
             "player_id": player.id,
@@ -175,15 +194,16 @@ class Game:
     
     def remove_player(self, player_id: str) -> Tuple[bool, str]:
         """Remove a player from the game."""
-        if player_id not in self.players:
+        try:
+            player = self.players[player_id]
+        except KeyError:
             return False, "Player not found"
         
-        player = self.players[player_id]
-        
         if self.phase == GamePhase.WAITING:
             # Before game starts, just remove
             del self.players[player_id]
             self.player_order.remove(player_id)
+            self._refresh_opponents()
         else:
             # During game, mark as bankrupt
             self._handle_bankruptcy(player, None)
@@ -201,7 +221,6 @@ class Game:
             return False, f"Need at least {self.min_players} players to start"
         
         # Randomize player order
-        import random
         random.shuffle(self.player_order)
         
         # Generate and assign random Pokemon to properties
@@ -223,6 +242,7 @@ class Game:
         
         self.phase = GamePhase.PRE_ROLL
         self.turn_number = 1
+        self._refresh_opponents()
         
         if self.current_player:
             self.current_player.reset_turn()
@@ -375,7 +395,7 @@ class Game:
     ) -> Tuple[bool, str, DiceResult]:
         """Handle what happens when player lands on a space."""
         space = self.board.get_space(player.position)
-        space_type = SpaceType(space["type"])
+        space_type = self.board.get_space_type(player.position)
         space_name = space["name"]
         
         if space_type == SpaceType.GO:
@@ -532,95 +552,135 @@ class Game:
         """Execute a card's action."""
         card_display_text = self.cards.get_card_display_text(card)
         
-        if card.action == CardAction.COLLECT_MONEY:
-            player.add_money(card.value)
-            self.phase = GamePhase.POST_ROLL
-            return True, f"{card_display_text} (+${card.value})", dice_result
-        
-        elif card.action == CardAction.PAY_MONEY:
-            if player.can_afford(card.value):
-                player.remove_money(card.value)
-                self.free_parking_pot += card.value  # House rule: fines go to Free Parking
-                self.phase = GamePhase.POST_ROLL
-            else:
-                self.phase = GamePhase.PAYING_RENT
-            return True, f"{card_display_text} (-${card.value}, Free Parking pot: ${self.free_parking_pot})", dice_result
-        
-        elif card.action == CardAction.COLLECT_FROM_PLAYERS:
-            total = 0
-            for other in self.active_players:
-                if other.id != player.id:
-                    amount = min(card.value, other.money)
-                    other.remove_money(amount)
-                    total += amount
-            player.add_money(total)
-            self.phase = GamePhase.POST_ROLL
-            return True, f"{card_display_text} (+${total})", dice_result
-        
-        elif card.action == CardAction.PAY_TO_PLAYERS:
-            total_owed = card.value * (len(self.active_players) - 1)
-            if player.can_afford(total_owed):
-                player.remove_money(total_owed)
-                for other in self.active_players:
-                    if other.id != player.id:
-                        other.add_money(card.value)
-                self.phase = GamePhase.POST_ROLL
-            else:
-                self.phase = GamePhase.PAYING_RENT
-            return True, f"{card_display_text} (-${total_owed})", dice_result
-        
-        elif card.action == CardAction.MOVE_TO:
-            if card.value == -1:
-                # Nearest utility
-                new_pos = self.rules.get_nearest_utility(player.position)
-            elif card.value == -2:
-                # Nearest railroad
-                new_pos = self.rules.get_nearest_railroad(player.position)
-            else:
-                new_pos = card.value
-            
-            old_pos = player.position
-            player.move_to(new_pos)
-            logger.debug(
-                f"CARD MOVE: {player.name} moved by card from {old_pos} to {new_pos} "
-                f"(actual: {player.position}), card='{card_display_text}'"
-            )
-            return self._handle_landing(player, dice_result)
-        
-        elif card.action == CardAction.MOVE_BACK:
-            new_pos = (player.position - card.value) % BOARD_SIZE
-            player.move_to(new_pos, collect_go=False)
-            return self._handle_landing(player, dice_result)
+        handler = self._CARD_HANDLERS.get(card.action)
+        if handler is not None:
+            return handler(self, player, card, card_display_text, dice_result)
         
-        elif card.action == CardAction.GO_TO_JAIL:
-            player.send_to_jail()
+        self.phase = GamePhase.POST_ROLL
+        return True, card_display_text, dice_result
+    
+    def _card_collect_money(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Pay the card's value from the bank to the player."""
+        player.add_money(card.value)
+        self.phase = GamePhase.POST_ROLL
+        return True, f"{text} (+${card.value})", dice_result
+    
+    def _card_pay_money(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Charge the card's value into the Free Parking pot."""
+        if player.can_afford(card.value):
+            player.remove_money(card.value)
+            self.free_parking_pot += card.value  # House rule: fines go to Free Parking
             self.phase = GamePhase.POST_ROLL
-            return True, card_display_text, dice_result
-        
-        elif card.action == CardAction.GET_OUT_OF_JAIL:
-            player.jail_cards += 1
+        else:
+            self.phase = GamePhase.PAYING_RENT
+        return True, f"{text} (-${card.value}, Free Parking pot: ${self.free_parking_pot})", dice_result
+    
+    def _card_collect_from_players(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Collect the card's value from each opponent, capped at their cash."""
+        value = card.value
+        total = 0
+        for other in self._opponents:
+            amount = min(value, other.money)
+            other.remove_money(amount)
+            total += amount
+        player.add_money(total)
+        self.phase = GamePhase.POST_ROLL
+        return True, f"{text} (+${total})", dice_result
+    
+    def _card_pay_to_players(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Pay the card's value to each opponent."""
+        value = card.value
+        opponents = self._opponents
+        total_owed = value * len(opponents)
+        if player.can_afford(total_owed):
+            player.remove_money(total_owed)
+            for other in opponents:
+                other.add_money(value)
             self.phase = GamePhase.POST_ROLL
-            return True, f"{card_display_text} (Card kept)", dice_result
-        
-        elif card.action == CardAction.REPAIRS:
-            total_cost = 0
-            for pos in player.properties:
-                prop = self.board.get_property(pos)
-                if prop:
-                    total_cost += prop.houses * card.per_house
-                    if prop.has_hotel:
-                        total_cost += card.per_hotel
-            
-            if player.can_afford(total_cost):
-                player.remove_money(total_cost)
-                self.free_parking_pot += total_cost  # House rule: repairs go to Free Parking
-                self.phase = GamePhase.POST_ROLL
-            else:
-                self.phase = GamePhase.PAYING_RENT
-            return True, f"{card_display_text} (-${total_cost}, Free Parking pot: ${self.free_parking_pot})", dice_result
+        else:
+            self.phase = GamePhase.PAYING_RENT
+        return True, f"{text} (-${total_owed})", dice_result
+    
+    def _card_move_to(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Move to the card's space (or nearest utility/railroad) and land there."""
+        if card.value == -1:
+            # Nearest utility
+            new_pos = self.rules.get_nearest_utility(player.position)
+        elif card.value == -2:
+            # Nearest railroad
+            new_pos = self.rules.get_nearest_railroad(player.position)
+        else:
+            new_pos = card.value
         
+        old_pos = player.position
+        player.move_to(new_pos)
+        logger.debug(
+            f"CARD MOVE: {player.name} moved by card from {old_pos} to {new_pos} "
+            f"(actual: {player.position}), card='{text}'"
+        )
+        return self._handle_landing(player, dice_result)
+    
+    def _card_move_back(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Move back the card's number of spaces without passing GO."""
+        new_pos = (player.position - card.value) % BOARD_SIZE
+        player.move_to(new_pos, collect_go=False)
+        return self._handle_landing(player, dice_result)
+    
+    def _card_go_to_jail(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Send the player straight to jail."""
+        player.send_to_jail()
         self.phase = GamePhase.POST_ROLL
-        return True, card_display_text, dice_result
+        return True, text, dice_result
+    
+    def _card_get_out_of_jail(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Keep a Get Out of Jail Free card."""
+        player.jail_cards += 1
+        self.phase = GamePhase.POST_ROLL
+        return True, f"{text} (Card kept)", dice_result
+    
+    def _card_repairs(
+        self, player: Player, card: Card, text: str, dice_result: DiceResult
+    ) -> Tuple[bool, str, DiceResult]:
+        """Charge per house and hotel owned into the Free Parking pot."""
+        houses, hotels = self.board.count_buildings(player.properties)
+        total_cost = houses * card.per_house + hotels * card.per_hotel
+        
+        if player.can_afford(total_cost):
+            player.remove_money(total_cost)
+            self.free_parking_pot += total_cost  # House rule: repairs go to Free Parking
+            self.phase = GamePhase.POST_ROLL
+        else:
+            self.phase = GamePhase.PAYING_RENT
+        return True, f"{text} (-${total_cost}, Free Parking pot: ${self.free_parking_pot})", dice_result
+    
+    # Card action -> handler; actions without an entry just end the move
+    _CARD_HANDLERS = {
+        CardAction.COLLECT_MONEY: _card_collect_money,
+        CardAction.PAY_MONEY: _card_pay_money,
+        CardAction.COLLECT_FROM_PLAYERS: _card_collect_from_players,
+        CardAction.PAY_TO_PLAYERS: _card_pay_to_players,
+        CardAction.MOVE_TO: _card_move_to,
+        CardAction.MOVE_BACK: _card_move_back,
+        CardAction.GO_TO_JAIL: _card_go_to_jail,
+        CardAction.GET_OUT_OF_JAIL: _card_get_out_of_jail,
+        CardAction.REPAIRS: _card_repairs,
+    }
     
     # =========== Property Actions ===========
     
@@ -950,11 +1010,8 @@ class Game:
             creditor.add_money(player.money)
             creditor.jail_cards += player.jail_cards
             
-            for pos in list(player.properties):
-                prop = self.board.get_property(pos)
-                if prop:
-                    prop.owner_id = creditor.id
-                    creditor.add_property(pos)
+            self.board.transfer_properties(player.properties, creditor.id)
+            creditor.add_properties(player.properties)
         else:
             # Return properties to bank
             for pos in list(player.properties):
@@ -972,6 +1029,7 @@ class Game:
                     prop.is_mortgaged = False
         
         player.declare_bankruptcy()
+        self._refresh_opponents()
         
         self._log_event("bankruptcy", {
             "player_id": player.id,
@@ -1019,9 +1077,8 @@ class Game:
         game.winner_id = data.get("winner_id")
         
         if data.get("last_dice_roll"):
-            from .dice import DiceResult
             roll = data["last_dice_roll"]
-            game.last_dice_roll = DiceResult(die1=roll[0], die2=roll[1])
+            game.last_dice_roll = DiceResult.of(roll[0], roll[1])
         
         # Load players
         for pid, pdata in data.get("players", {}).items():
@@ -1031,6 +1088,7 @@ class Game:
         game.board = Board.from_dict(data.get("board", {}))
         game.rules = RuleEngine(game.board)
         game.rules.load_state(data.get("rules", {}))
+        game._refresh_opponents()
         
         # Load house rules state
         game.free_parking_pot = data.get("free_parking_pot", FREE_PARKING_BASE)
@@ -1043,7 +1101,9 @@ class Game:
         Hides other players' private information if needed.
         """
         # Log positions being sent for debugging
-        positions = {pid: self.players[pid].position for pid in self.player_order if pid in self.players}
+        players = self.players
+        ordered = [players[pid] for pid in self.player_order if pid in players]
+        positions = {p.id: p.position for p in ordered}
         logger.debug(f"STATE for {player_id}: positions={positions}, turn={self.turn_number}")
         
         return {
@@ -1054,11 +1114,7 @@ class Game:
             "current_player_id": self.current_player.id if self.current_player else None,
             "is_your_turn": self.current_player and self.current_player.id == player_id,
             "last_dice_roll": self.last_dice_roll.to_list() if self.last_dice_roll else None,
-            "players": [
-                self.players[pid].to_dict()
-                for pid in self.player_order
-                if pid in self.players
-            ],
+            "players": [p.to_dict() for p in ordered],
             "board": {
                 pos: prop.to_dict()
                 for pos, prop in self.board.properties.items()
@@ -2,15 +2,12 @@
 Player state management.
 """
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Iterable, Set
+import logging
 import uuid
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from shared.enums import PlayerState
-from shared.constants import STARTING_MONEY
+from shared.constants import STARTING_MONEY, BOARD_SIZE, SALARY_AMOUNT, JAIL_POSITION
 
 
 @dataclass
@@ -80,9 +77,6 @@ class Player:
         Returns:
             True if player passed GO
         """
-        from shared.constants import BOARD_SIZE, SALARY_AMOUNT
-        import logging
-        
         old_position = self.position
         passed_go = False
         if collect_go and position < self.position and self.state != PlayerState.IN_JAIL:
@@ -93,8 +87,8 @@ class Player:
         self.position = position % BOARD_SIZE
         
         logging.debug(
-            f"Player.move_to: {self.name} {old_position} -> {self.position} "
-            f"(requested {position}, passed_go={passed_go})"
+            "Player.move_to: %s %d -> %d (requested %d, passed_go=%s)",
+            self.name, old_position, self.position, position, passed_go
         )
         return passed_go
     
@@ -108,15 +102,11 @@ class Player:
         Returns:
             True if player passed GO
         """
-        from shared.constants import BOARD_SIZE
-        
         new_position = (self.position + spaces) % BOARD_SIZE
         return self.move_to(new_position)
     
     def send_to_jail(self) -> None:
         """Send player to jail."""
-        from shared.constants import JAIL_POSITION
-        
         self.position = JAIL_POSITION
         self.state = PlayerState.IN_JAIL
         self.jail_turns = 0
@@ -131,6 +121,10 @@ class Player:
         """Add a property to player's ownership."""
         self.properties.add(position)
     
+    def add_properties(self, positions: Iterable[int]) -> None:
+        """Add several properties to player's ownership."""
+        self.properties.update(positions)
+    
     def remove_property(self, position: int) -> None:
         """Remove a property from player's ownership."""
         self.properties.discard(position)
@@ -5,12 +5,8 @@ from dataclasses import dataclass
 from typing import List, Tuple, Optional
 from enum import Enum, auto
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-
 from shared.constants import (
-    BOARD_SIZE, JAIL_POSITION, GO_TO_JAIL_POSITION,
+    JAIL_POSITION, GO_TO_JAIL_POSITION,
     MAX_JAIL_TURNS, JAIL_BAIL, MAX_HOUSES_PER_PROPERTY,
     TOTAL_HOUSES, TOTAL_HOTELS, BOARD_SPACES
 )
@@ -477,6 +473,12 @@ class RuleEngine:
                 "It's not your turn"
             )
         
+        if phase in (GamePhase.WAITING, GamePhase.GAME_OVER):
+            return ValidationResult.failure(
+                ActionResult.GAME_NOT_STARTED,
+                "Game is not in progress"
+            )
+        
         if phase == GamePhase.PRE_ROLL:
             return ValidationResult.failure(
                 ActionResult.MUST_ROLL,
@@ -630,23 +632,15 @@ class RuleEngine:
         """Get position of nearest utility from given position."""
         utilities = [12, 28]  # Electric Company, Water Works
         
-        for i in range(1, BOARD_SIZE):
-            check_pos = (position + i) % BOARD_SIZE
-            if check_pos in utilities:
-                return check_pos
-        
-        return utilities[0]
+        # First one ahead of position, wrapping past GO to the first on the board
+        return next((pos for pos in utilities if pos > position), utilities[0])
     
     def get_nearest_railroad(self, position: int) -> int:
         """Get position of nearest railroad from given position."""
         railroads = [5, 15, 25, 35]
         
-        for i in range(1, BOARD_SIZE):
-            check_pos = (position + i) % BOARD_SIZE
-            if check_pos in railroads:
-                return check_pos
-        
-        return railroads[0]
+        # First one ahead of position, wrapping past GO to the first on the board
+        return next((pos for pos in railroads if pos > position), railroads[0])
     
     def to_dict(self) -> dict:
         """Convert rule engine state to dictionary."""
@@ -0,0 +1,34 @@
+"""
+Shared fixtures for the pytest tests.
+"""
+import pytest
+
+from server.game_engine import DiceResult
+from tests.helpers import game_snapshot
+
+
+@pytest.fixture
+def game():
+    """A fresh, started two-player game."""
+    return game_snapshot()
+
+
+@pytest.fixture
+def player(game):
+    """The current player of `game`."""
+    return game.current_player
+
+
+@pytest.fixture
+def opponent(game):
+    """The next opponent of `game`'s current player."""
+    return game.opponents[0]
+
+
+@pytest.fixture
+def script_rolls(monkeypatch):
+    """Make a game's dice return the given (die1, die2) rolls in order."""
+    def script(game, *rolls):
+        results = iter([DiceResult.of(d1, d2) for d1, d2 in rolls])
+        monkeypatch.setattr(game.dice, "roll", lambda: next(results))
+    return script
@@ -0,0 +1,69 @@
+"""Game builders and setup helpers shared by the pytest tests."""
+import pickle
+from typing import Dict, Optional, Tuple
+
+from server.game_engine import Game
+from shared.enums import GamePhase, PlayerState
+
+
+def create_test_game(n_players: int = 2, start: bool = True) -> Game:
+    """Create a game with n_players, started unless start=False."""
+    game = Game(name="Test")
+    for name in ("Alice", "Bob", "Charlie", "Diana")[:n_players]:
+        game.add_player(name)
+    if start:
+        game.start_game()
+    return game
+
+
+def create_minimal_game(n_players: int = 3) -> Game:
+    """
+    Create an in-progress game without running start_game().
+    
+    Skips the Pokemon and item assignment that dominates start_game(),
+    for tests that only exercise turn order and player state.
+    """
+    game = create_test_game(n_players, start=False)
+    game.phase = GamePhase.PRE_ROLL
+    game.turn_number = 1
+    return game
+
+
+def next_player_id(game: Game) -> Optional[str]:
+    """The ID of the player who gets the turn next, skipping bankrupt players."""
+    order = game.player_order
+    for step in range(1, len(order)):
+        pid = order[(game.current_player_index + step) % len(order)]
+        if game.players[pid].state != PlayerState.BANKRUPT:
+            return pid
+    return None
+
+
+# Pickled games keyed by (player count, minimal), built on first use
+_SNAPSHOTS: Dict[Tuple[int, bool], bytes] = {}
+
+
+def game_snapshot(n_players: int = 2, minimal: bool = False) -> Game:
+    """
+    Return a fresh copy of a started game with n_players, or of a
+    create_minimal_game() game if minimal is set.
+    """
+    key = (n_players, minimal)
+    blob = _SNAPSHOTS.get(key)
+    if blob is None:
+        game = create_minimal_game(n_players) if minimal else create_test_game(n_players)
+        blob = _SNAPSHOTS[key] = pickle.dumps(game, protocol=pickle.HIGHEST_PROTOCOL)
+    return pickle.loads(blob)
+
+
+def assign_properties(game: Game, player, *positions, **state) -> None:
+    """
+    Give player the properties at positions, then set any other Property
+    fields passed as keywords (houses=, has_hotel=, is_mortgaged=) on each.
+    """
+    game.board.transfer_properties(positions, player.id)
+    player.add_properties(positions)
+    properties = game.board.properties
+    for pos in positions:
+        for name, value in state.items():
+            setattr(properties[pos], name, value)
@@ -0,0 +1,148 @@
+"""
+Jail tests: going to jail, the three ways out, and the turn limit.
+"""
+import pytest
+
+from server.game_engine import DiceResult
+from shared.constants import (
+    GO_TO_JAIL_POSITION, JAIL_BAIL, JAIL_POSITION, MAX_JAIL_TURNS, STARTING_MONEY
+)
+from shared.enums import GamePhase, PlayerState
+from tests.helpers import next_player_id
+
+
+@pytest.fixture
+def jailed_game(game):
+    """A fresh game (in PRE_ROLL) whose current player was just sent to jail."""
+    player = game.current_player
+    player.send_to_jail()
+    return game, player
+
+
+def test_send_to_jail(game, player):
+    player.position = 35
+    player.consecutive_doubles = 2
+    player.send_to_jail()
+    assert player.state == PlayerState.IN_JAIL
+    assert player.position == JAIL_POSITION
+    assert player.jail_turns == 0
+    assert player.consecutive_doubles == 0
+    assert player.money == STARTING_MONEY, "Collected GO salary on the way to jail"
+
+
+@pytest.mark.parametrize("money,in_jail,expected", [
+    pytest.param(STARTING_MONEY, True, True, id="sufficient_funds"),
+    pytest.param(JAIL_BAIL - 1, True, False, id="insufficient_funds"),
+    pytest.param(STARTING_MONEY, False, False, id="not_in_jail"),
+])
+def test_pay_bail(game, player, money, in_jail, expected):
+    player.money = money
+    if in_jail:
+        player.send_to_jail()
+    ok, msg = game.pay_bail(player.id)
+    assert ok == expected, msg
+    assert player.state == (PlayerState.IN_JAIL if in_jail and not ok else PlayerState.ACTIVE)
+    assert player.money == (money - JAIL_BAIL if ok else money)
+
+
+@pytest.mark.parametrize("in_jail,jail_cards,own_turn,expected", [
+    pytest.param(True, 1, True, True, id="has_card"),
+    pytest.param(True, 0, True, False, id="no_card"),
+    pytest.param(False, 1, True, False, id="not_in_jail"),
+    pytest.param(True, 1, False, False, id="not_your_turn"),
+])
+def test_use_get_out_of_jail_card(game, in_jail, jail_cards, own_turn, expected):
+    actor = game.current_player if own_turn else game.opponents[0]
+    if in_jail:
+        actor.send_to_jail()
+    actor.jail_cards = jail_cards
+    ok, msg = game.use_jail_card(actor.id)
+    assert ok == expected, msg
+    assert actor.state == (PlayerState.IN_JAIL if in_jail and not ok else PlayerState.ACTIVE)
+    assert actor.jail_cards == (jail_cards - 1 if ok else jail_cards)
+
+
+def test_jail_card_returns_to_deck(jailed_game):
+    game, player = jailed_game
+    player.jail_cards = 1
+    discards = len(game.cards.chance.discard)
+    ok, msg = game.use_jail_card(player.id)
+    assert ok, msg
+    assert len(game.cards.chance.discard) == discards + 1
+
+
+@pytest.mark.parametrize("roll,jail_turns,released,position,bail", [
+    # Doubles: released and moved by the roll
+    pytest.param((3, 3), 0, True, JAIL_POSITION + 6, 0, id="doubles"),
+    # No doubles: stays in jail
+    pytest.param((2, 3), 0, False, JAIL_POSITION, 0, id="no_doubles"),
+    # Out of attempts: bail is taken and the roll is moved
+    pytest.param((2, 3), MAX_JAIL_TURNS, True, JAIL_POSITION + 5, JAIL_BAIL, id="last_attempt"),
+])
+def test_roll_doubles_to_escape_jail(jailed_game, script_rolls,
+                                     roll, jail_turns, released, position, bail):
+    game, player = jailed_game
+    player.jail_turns = jail_turns
+    script_rolls(game, roll)
+    ok, msg, _ = game.roll_dice(player.id)
+    assert ok, msg
+    assert player.state == (PlayerState.ACTIVE if released else PlayerState.IN_JAIL)
+    assert player.position == position
+    assert player.money == STARTING_MONEY - bail
+
+
+def test_forced_bail_without_funds(jailed_game, script_rolls):
+    game, player = jailed_game
+    player.jail_turns = MAX_JAIL_TURNS
+    player.money = JAIL_BAIL - 1
+    script_rolls(game, (2, 3))
+    ok, msg, _ = game.roll_dice(player.id)
+    assert ok, msg
+    assert player.state == PlayerState.IN_JAIL
+    assert game.phase == GamePhase.PAYING_RENT
+
+
+def test_just_visiting_jail(game, player, script_rolls):
+    player.position = JAIL_POSITION - 7
+    script_rolls(game, (3, 4))
+    ok, msg, _ = game.roll_dice(player.id)
+    assert ok, msg
+    assert player.position == JAIL_POSITION
+    assert player.state == PlayerState.ACTIVE
+
+    # Ending the turn hands over normally; nobody is jailed
+    player2_id = next_player_id(game)
+    ok, msg = game.end_turn(player.id)
+    assert ok, msg
+    assert game.current_player.id == player2_id
+    assert player.state == PlayerState.ACTIVE
+
+
+def test_land_on_go_to_jail(game, player, script_rolls):
+    player.position = GO_TO_JAIL_POSITION - 7
+    script_rolls(game, (3, 4))
+    ok, msg, _ = game.roll_dice(player.id)
+    assert ok, msg
+    assert player.state == PlayerState.IN_JAIL
+    assert player.position == JAIL_POSITION
+    assert player.money == STARTING_MONEY
+
+
+def test_three_doubles_go_to_jail(game, player, script_rolls):
+    player.consecutive_doubles = 2
+    script_rolls(game, (3, 3))
+    ok, msg, _ = game.roll_dice(player.id)
+    assert ok, msg
+    assert player.state == PlayerState.IN_JAIL
+    assert player.position == JAIL_POSITION
+
+
+def test_jail_turns_count_on_turn_start(game, player):
+    other = game.opponents[0]
+    other.send_to_jail()
+    game.phase = GamePhase.POST_ROLL
+    game.last_dice_roll = DiceResult.of(2, 3)
+    ok, msg = game.end_turn(player.id)
+    assert ok, msg
+    assert game.current_player is other
+    assert other.jail_turns == 1
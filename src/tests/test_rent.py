@@ -0,0 +1,127 @@
+"""
+Rent tests: undeveloped, monopoly, houses/hotel, mortgaged, railroads
+and utilities.
+"""
+from functools import partial
+
+import pytest
+
+from shared.constants import STARTING_MONEY
+from tests.helpers import assign_properties, create_minimal_game
+
+
+def reset_game(game) -> None:
+    """Clear ownership, buildings and mortgages, and restore player cash."""
+    game.board.reset()
+    for player in game.players.values():
+        player.properties.clear()
+        player.money = STARTING_MONEY
+
+
+# (houses on Mediterranean, rent); the brown monopoly is owned
+HOUSE_CASES = ((1, 10), (2, 30), (3, 90), (4, 160))
+# (railroads owned, rent on Reading); owned in board order from Reading
+RR_CASES = ((1, 25), (2, 50), (3, 100), (4, 200))
+RAILROADS = (5, 15, 25, 35)
+# Every possible dice total, and the utility rent for each by utilities owned
+DICE_TOTALS = tuple(range(2, 13))
+UTILITY_RENTS = {
+    owned: tuple(roll * multiplier for roll in DICE_TOTALS)
+    for owned, multiplier in ((1, 4), (2, 10))
+}
+
+
+@pytest.fixture(scope="module")
+def base_game():
+    # Rent never reads decks or Pokemon data, so start_game() is skipped
+    return create_minimal_game(2)
+
+
+@pytest.fixture
+def game(base_game):
+    """The module's shared game, reset to no ownership."""
+    reset_game(base_game)
+    return base_game
+
+
+@pytest.fixture
+def rent(game, opponent):
+    """calculate_rent bound to the board with opponent as the landing player."""
+    return partial(game.board.calculate_rent, landing_player_id=opponent.id)
+
+
+@pytest.mark.quick
+def test_unowned_property_rent(rent):
+    assert rent(1) == 0
+    assert rent(5) == 0
+    assert rent(12, dice_roll=7) == 0
+
+
+@pytest.mark.quick
+def test_no_rent_on_own_property(game, player):
+    assign_properties(game, player, 1, 3)
+    assert game.board.calculate_rent(1, landing_player_id=player.id) == 0
+
+
+def test_base_rent(game, player, rent):
+    assign_properties(game, player, 1)
+    assert rent(1) == 2
+    assign_properties(game, player, 37)
+    assert rent(37) == 35
+
+
+def _brown(**med_state):
+    """Own Mediterranean (1) and Baltic (3), with med_state set on 1."""
+    def mutate(game, player):
+        assign_properties(game, player, 3)
+        assign_properties(game, player, 1, **med_state)
+    return mutate
+
+
+# (ownership/development, position landed on, rent); each case starts
+# from a reset game
+BROWN_CASES = [
+    pytest.param(lambda game, player: assign_properties(game, player, 1), 1, 2,
+                 id="single"),
+    pytest.param(_brown(), 1, 4, id="monopoly"),
+    pytest.param(_brown(), 3, 8, id="monopoly_other"),
+    pytest.param(_brown(is_mortgaged=True), 1, 0, id="mortgaged"),
+    # The unmortgaged half of the monopoly still charges double
+    pytest.param(_brown(is_mortgaged=True), 3, 8, id="mortgaged_other"),
+    pytest.param(_brown(has_hotel=True), 1, 250, id="hotel"),
+    pytest.param(_brown(has_hotel=True), 3, 8, id="hotel_other"),
+]
+
+
+@pytest.mark.parametrize("houses,expected", HOUSE_CASES)
+def test_house_rent(game, player, rent, houses, expected):
+    _brown(houses=houses)(game, player)
+    assert rent(1) == expected
+
+
+@pytest.mark.quick
+@pytest.mark.parametrize("mutate,pos,expected", BROWN_CASES)
+def test_brown_rent(game, player, rent, mutate, pos, expected):
+    mutate(game, player)
+    assert rent(pos) == expected
+
+
+@pytest.mark.parametrize("owned,expected", RR_CASES)
+def test_railroad_rent_scaling(game, player, rent, owned, expected):
+    assign_properties(game, player, *RAILROADS[:owned])
+    assert rent(5) == expected
+
+
+@pytest.mark.parametrize("owned", sorted(UTILITY_RENTS))
+def test_utility_rent(game, player, rent, owned):
+    assign_properties(game, player, *(12, 28)[:owned])
+    rents = tuple(rent(12, dice_roll=roll) for roll in DICE_TOTALS)
+    assert rents == UTILITY_RENTS[owned]
+
+
+def test_expensive_property_rent(game, player, rent):
+    assign_properties(game, player, 37, 39)
+    boardwalk = game.board.get_property(39)
+    assert rent(39) == 100
+    boardwalk.has_hotel = True
+    assert rent(39) == 2000
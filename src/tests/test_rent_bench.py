@@ -0,0 +1,41 @@
+"""
+Microbenchmarks for Board.calculate_rent, one per rent rule.
+
+Needs pytest-benchmark (in requirements-dev.txt); skipped without it.
+
+    python -m pytest tests/test_rent_bench.py --benchmark-only
+"""
+import pytest
+
+from tests.helpers import create_minimal_game
+
+pytest.importorskip("pytest_benchmark")
+
+
+# (position, dice_roll, owned positions, expected rent)
+CASES = [
+    pytest.param(1, 0, (1, 3), 4, id="property_monopoly"),
+    pytest.param(5, 0, (5, 15, 25, 35), 200, id="railroad_4"),
+    pytest.param(12, 7, (12, 28), 70, id="utility_2"),
+]
+
+
+@pytest.fixture(scope="module")
+def bench_game():
+    return create_minimal_game(2)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_up(bench_game):
+    """Call calculate_rent once so first-call costs stay out of the timings."""
+    bench_game.board.calculate_rent(1)
+
+
+@pytest.mark.parametrize("pos,dice_roll,owned,expected", CASES)
+def test_calculate_rent_speed(benchmark, bench_game, pos, dice_roll, owned, expected):
+    board = bench_game.board
+    board.reset()
+    owner, lander = bench_game.player_order
+    board.transfer_properties(owned, owner)
+    rent = benchmark(board.calculate_rent, pos, dice_roll, lander)
+    assert rent == expected
@@ -0,0 +1,33 @@
+"""
+Pytest entry point for the single-file suite in run_tests.py.
+
+Each section of the suite runs as its own test item, so pytest's
+selection (-k, -m "not slow"), fail-fast (-x), last-failed reruns (--lf)
+and, when pytest-xdist is installed, parallel workers (-n auto) all work
+on top of the existing checks. `python run_tests.py` remains the
+colored standalone runner.
+"""
+import pytest
+
+import run_tests
+
+
+def _section_id(section) -> str:
+    return section.__name__[len("test_"):]
+
+
+def _run_section(section) -> None:
+    # Passing checks are dropped; a failure report needs only the misses
+    result, output = run_tests._run_one(section, show_passes=False)
+    assert result.failed == 0, f"{result.failed} check(s) failed:\n{output}"
+
+
+@pytest.mark.parametrize("section", run_tests.UNIT_TESTS, ids=_section_id)
+def test_unit(section):
+    _run_section(section)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("section", run_tests.SLOW_TESTS, ids=_section_id)
+def test_slow(section):
+    _run_section(section)
@@ -0,0 +1,110 @@
+"""
+Trade validation tests: what each side may offer, and what gets rejected.
+"""
+import pytest
+
+from server.game_engine import ActionResult
+from shared.constants import STARTING_MONEY
+from tests.helpers import assign_properties, game_snapshot
+
+
+def propose(game, from_player, to_player, **terms):
+    """Validate a trade; terms default to nothing offered or requested."""
+    return game.rules.validate_trade(
+        from_player,
+        to_player,
+        offered_money=terms.get("offered_money", 0),
+        requested_money=terms.get("requested_money", 0),
+        offered_properties=terms.get("offered_properties", []),
+        requested_properties=terms.get("requested_properties", []),
+        offered_jail_cards=terms.get("offered_jail_cards", 0),
+        requested_jail_cards=terms.get("requested_jail_cards", 0),
+    )
+
+
+@pytest.fixture
+def game():
+    """A fresh two-player game in PRE_ROLL, without start_game() state."""
+    return game_snapshot(2, minimal=True)
+
+
+# =========== Scenario setups ===========
+
+def _nothing(game, player, opponent):
+    pass
+
+
+def _swap_1_for_3(game, player, opponent):
+    assign_properties(game, player, 1)
+    assign_properties(game, opponent, 3)
+
+
+def _player_owns_6(game, player, opponent):
+    assign_properties(game, player, 6)
+
+
+def _player_owns_1_mortgaged(game, player, opponent):
+    assign_properties(game, player, 1, is_mortgaged=True)
+
+
+def _player_owns_3(game, player, opponent):
+    assign_properties(game, player, 3)
+
+
+def _player_brown_with_house(game, player, opponent):
+    assign_properties(game, player, 3)
+    assign_properties(game, player, 1, houses=1)
+
+
+def _opponent_dark_blue_with_hotel(game, player, opponent):
+    assign_properties(game, opponent, 37)
+    assign_properties(game, opponent, 39, has_hotel=True)
+
+
+def _opponent_has_100(game, player, opponent):
+    opponent.money = 100
+
+
+def _player_jail_card(game, player, opponent):
+    player.jail_cards = 1
+
+
+# (setup, trade terms, expected failure or None for a valid trade)
+TRADE_CASES = [
+    pytest.param(_swap_1_for_3, dict(offered_properties=[1], requested_properties=[3]),
+                 None, id="property_swap"),
+    pytest.param(_player_owns_6, dict(offered_properties=[6], requested_money=200),
+                 None, id="property_for_money"),
+    pytest.param(_player_owns_1_mortgaged, dict(offered_properties=[1], requested_money=10),
+                 None, id="mortgaged_property"),
+    pytest.param(_player_jail_card, dict(offered_jail_cards=1, requested_money=50),
+                 None, id="jail_card_for_money"),
+    pytest.param(_nothing, dict(offered_properties=[5]),
+                 ActionResult.NOT_OWNER, id="offer_unowned"),
+    pytest.param(_player_owns_3, dict(offered_money=50, requested_properties=[3]),
+                 ActionResult.NOT_OWNER, id="request_not_theirs"),
+    pytest.param(_player_brown_with_house, dict(offered_properties=[1]),
+                 ActionResult.HAS_BUILDINGS, id="offer_with_houses"),
+    pytest.param(_opponent_dark_blue_with_hotel, dict(offered_money=500, requested_properties=[39]),
+                 ActionResult.HAS_BUILDINGS, id="request_with_hotel"),
+    pytest.param(_nothing, dict(offered_money=STARTING_MONEY + 1),
+                 ActionResult.INSUFFICIENT_FUNDS, id="offer_too_much"),
+    pytest.param(_opponent_has_100, dict(requested_money=101),
+                 ActionResult.INSUFFICIENT_FUNDS, id="request_too_much"),
+    pytest.param(_nothing, dict(offered_jail_cards=1),
+                 ActionResult.INVALID_TRADE, id="offer_missing_jail_card"),
+    pytest.param(_nothing, dict(requested_jail_cards=1),
+                 ActionResult.INVALID_TRADE, id="request_missing_jail_card"),
+    pytest.param(_nothing, dict(),
+                 ActionResult.INVALID_TRADE, id="empty"),
+]
+
+
+@pytest.mark.parametrize("setup,terms,failure", TRADE_CASES)
+def test_validate_trade(game, player, opponent, setup, terms, failure):
+    setup(game, player, opponent)
+    v = propose(game, player, opponent, **terms)
+    if failure is None:
+        assert v.valid, v.message
+    else:
+        assert not v.valid and v.result == failure, v.message
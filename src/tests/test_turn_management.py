@@ -0,0 +1,85 @@
+"""
+Turn management tests: rolling, doubles and handing the turn over.
+"""
+import pytest
+
+from server.game_engine import Dice, DiceResult
+from shared.enums import GamePhase
+from tests.helpers import game_snapshot
+
+
+@pytest.fixture(params=(42, 7, 1), ids=lambda seed: f"seed{seed}")
+def seed(request):
+    return request.param
+
+
+@pytest.fixture
+def seeded_game(game, seed):
+    """A fresh started game whose dice are seeded with `seed`."""
+    game.dice.set_seed(seed)
+    return game
+
+
+def test_seeded_dice_repeat(seeded_game, seed):
+    rolls = [seeded_game.dice.roll() for _ in range(10)]
+    seeded_game.dice.set_seed(seed)
+    assert [seeded_game.dice.roll() for _ in range(10)] == rolls
+
+
+def test_roll_uses_game_dice(seeded_game, seed):
+    expected = Dice(seed).roll()
+    player = seeded_game.current_player
+    ok, msg, result = seeded_game.roll_dice(player.id)
+    assert ok, msg
+    assert result == expected
+    assert seeded_game.last_dice_roll is result
+    assert player.has_rolled
+    assert seeded_game.phase != GamePhase.PRE_ROLL
+
+
+def finish_roll(game, die1=2, die2=3) -> None:
+    """Put game in POST_ROLL as if the current player had just rolled."""
+    game.phase = GamePhase.POST_ROLL
+    game.last_dice_roll = DiceResult.of(die1, die2)
+    game.current_player.has_rolled = True
+
+
+@pytest.mark.parametrize("n_players", (2, 3, 4))
+def test_turns_follow_player_order(n_players):
+    game = game_snapshot(n_players)
+    order, start = game.player_order, game.turn_number
+    first = game.current_player_index
+    for turn in range(1, n_players + 2):
+        finish_roll(game)
+        ok, msg = game.end_turn(game.current_player.id)
+        assert ok, msg
+        assert game.current_player.id == order[(first + turn) % n_players]
+        assert game.turn_number == start + turn
+        assert game.phase == GamePhase.PRE_ROLL
+        assert not game.current_player.has_rolled
+
+
+def test_doubles_keep_the_turn(game, player):
+    finish_roll(game, 3, 3)
+    player.consecutive_doubles = 1
+    ok, msg = game.end_turn(player.id)
+    assert ok, msg
+    assert game.current_player is player
+    assert game.phase == GamePhase.PRE_ROLL
+    assert not player.has_rolled
+
+
+def test_rolled_doubles_then_non_doubles(game, player, script_rolls):
+    script_rolls(game, (3, 3), (2, 5))
+    ok, msg, roll = game.roll_dice(player.id)
+    assert ok and roll.is_double, msg
+    assert player.consecutive_doubles == 1
+    game.phase = GamePhase.POST_ROLL
+    assert game.end_turn(player.id)[0]
+    assert game.current_player is player
+
+    ok, msg, roll = game.roll_dice(player.id)
+    assert ok and not roll.is_double, msg
+    game.phase = GamePhase.POST_ROLL
+    assert game.end_turn(player.id)[0]
+    assert game.current_player is not player
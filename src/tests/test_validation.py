@@ -0,0 +1,258 @@
+"""
+Edge-case and validation tests for the game engine.
+
+Every action must reject bad input (positions off the board, the wrong
+player, the wrong phase) without touching game state. These are plain
+pytest tests, so they parallelize with pytest-xdist:
+
+    python -m pytest -n auto
+"""
+import pytest
+
+from server.game_engine import Player, DiceResult
+from shared.constants import BOARD_SIZE, JAIL_POSITION, STARTING_MONEY
+from shared.enums import GamePhase, PlayerState
+from tests.helpers import (
+    assign_properties, create_minimal_game, create_test_game, game_snapshot,
+    next_player_id,
+)
+
+
+INVALID_POSITIONS = pytest.mark.parametrize("pos", [
+    pytest.param(-1, id="negative"),
+    pytest.param(50, id="beyond"),
+    pytest.param(BOARD_SIZE, id="boundary"),
+    pytest.param(999999, id="huge"),
+    pytest.param(0, id="GO"),
+    pytest.param(JAIL_POSITION, id="jail"),
+])
+
+
+# Any non-double roll; DiceResult is frozen, so tests can share it
+STANDARD_ROLL = DiceResult.of(3, 4)
+
+
+# =========== Invalid Positions ===========
+
+@INVALID_POSITIONS
+def test_invalid_position_build_house(game, pos):
+    ok, msg = game.build_house(game.current_player.id, pos)
+    assert not ok, f"build_house({pos}) accepted: {msg}"
+    assert game.current_player.money == STARTING_MONEY
+
+
+@INVALID_POSITIONS
+def test_invalid_position_mortgage(game, pos):
+    ok, msg = game.mortgage_property(game.current_player.id, pos)
+    assert not ok, f"mortgage_property({pos}) accepted: {msg}"
+    assert game.current_player.money == STARTING_MONEY
+
+
+@INVALID_POSITIONS
+def test_invalid_position_sell_building(game, pos):
+    ok, msg = game.sell_building(game.current_player.id, pos)
+    assert not ok, f"sell_building({pos}) accepted: {msg}"
+    assert game.current_player.money == STARTING_MONEY
+
+
+def test_validate_build_house_positions(game, player):
+    assign_properties(game, player, 1, 3)
+    positions = [-1, 1, 3, 6, BOARD_SIZE, JAIL_POSITION]
+    validate = game.rules.validate_build_house
+    results = [validate(player, pos, player.id).valid for pos in positions]
+    assert results == [False, True, True, False, False, False]
+    assert player.money == STARTING_MONEY
+    assert game.board.get_property(1).houses == 0
+
+    other = game.opponents[0]
+    assert not any(validate(other, pos, player.id).valid for pos in positions)
+
+
+# =========== Boundaries ===========
+
+@pytest.mark.parametrize("start,delta,expected", [(39, 3, 2), (0, 47, 7), (5, 80, 5)])
+def test_position_wraparound(start, delta, expected):
+    player = Player(name="T")
+    player.position = start
+    player.move_forward(delta)
+    assert player.position == expected
+
+
+@pytest.mark.parametrize("money,amount,affordable", [
+    (0, 0, True),
+    (0, 1, False),
+    (100, 100, True),
+    (100, 101, False),
+])
+def test_money_boundary_conditions(money, amount, affordable):
+    player = Player(name="T", money=money)
+    assert player.can_afford(amount) == affordable
+    assert player.remove_money(amount) == affordable
+    assert player.money == (money - amount if affordable else money)
+
+
+@pytest.mark.parametrize("existing,accepted", [(1, True), (3, True), (4, False)])
+def test_max_players_boundary(existing, accepted):
+    game = create_test_game(existing, start=False)
+    ok, msg, player = game.add_player("Eve")
+    assert ok == accepted, msg
+    assert (player is not None) == accepted
+    assert len(game.players) <= game.max_players
+
+
+# =========== Lifecycle ===========
+
+# Rejections leave the game untouched, so each class shares one game
+@pytest.fixture(scope="class")
+def started_game():
+    return game_snapshot()
+
+
+class TestLifecycleRejections:
+    """Lifecycle actions a started game must refuse."""
+    
+    def test_add_player_after_game_start(self, started_game):
+        ok, msg, player = started_game.add_player("Late")
+        assert not ok and player is None, f"Late join accepted: {msg}"
+        assert len(started_game.players) == 2
+    
+    def test_start_game_twice(self, started_game):
+        ok, msg = started_game.start_game()
+        assert not ok, f"Second start accepted: {msg}"
+        assert started_game.phase == GamePhase.PRE_ROLL
+
+
+def test_start_game_with_insufficient_players():
+    game = create_test_game(1, start=False)
+    ok, msg = game.start_game()
+    assert not ok, f"Started with one player: {msg}"
+    assert game.phase == GamePhase.WAITING
+
+
+# =========== Wrong Phase / Wrong Player ===========
+
+def _before_start():
+    game = create_test_game(start=False)
+    return game, game.player_order[0]
+
+
+def _after_game_over():
+    game = game_snapshot()
+    player = game.current_player
+    game.declare_bankruptcy(game.opponents[0].id)
+    assert game.phase == GamePhase.GAME_OVER
+    game.last_dice_roll = STANDARD_ROLL
+    return game, player.id
+
+
+ACTIONS = {
+    "roll": lambda g, pid: g.roll_dice(pid)[:2],
+    "buy": lambda g, pid: g.buy_property(pid),
+    "end_turn": lambda g, pid: g.end_turn(pid),
+}
+
+
+@pytest.mark.parametrize("setup", [
+    pytest.param(_before_start, id="waiting"),
+    pytest.param(_after_game_over, id="game_over"),
+])
+@pytest.mark.parametrize("action", ACTIONS.values(), ids=ACTIONS.keys())
+def test_action_rejected(setup, action):
+    game, actor_id = setup()
+    phase, current = game.phase, game.current_player
+    ok, msg = action(game, actor_id)
+    assert not ok, f"Action accepted: {msg}"
+    assert game.phase == phase and game.current_player is current
+
+
+def _ready_for(game, phase):
+    """Put game in phase with the current player free to act in it."""
+    current = game.current_player
+    game.phase = phase
+    current.position = 1  # Mediterranean, unowned
+    if phase == GamePhase.POST_ROLL:
+        game.last_dice_roll = STANDARD_ROLL
+        current.has_rolled = True
+    return game
+
+
+@pytest.mark.parametrize("name,phase", [
+    ("roll", GamePhase.PRE_ROLL),
+    ("buy", GamePhase.PROPERTY_DECISION),
+    ("end_turn", GamePhase.POST_ROLL),
+])
+def test_wrong_player_rejected(game, name, phase):
+    action, current = ACTIONS[name], game.current_player
+
+    legal = _ready_for(game_snapshot(), phase)
+    ok, msg = action(legal, legal.current_player.id)
+    assert ok, f"{name} not legal for the current player: {msg}"
+
+    _ready_for(game, phase)
+    ok, msg = action(game, game.opponents[0].id)
+    assert not ok and msg == "It's not your turn", f"Out-of-turn {name}: {msg}"
+    assert game.phase == phase and game.current_player is current
+
+
+def test_bankrupt_player_operations():
+    game = create_minimal_game(3)
+    first, second, third = (game.players[pid] for pid in game.player_order)
+    assert next_player_id(game) == second.id
+    game.declare_bankruptcy(second.id)
+    assert second.state == PlayerState.BANKRUPT
+    assert not game.is_game_over
+
+    # Bankrupt players are skipped in turn order (checked below), so the
+    # turn check is what keeps them from acting
+    ok, msg, _ = game.roll_dice(second.id)
+    assert not ok, f"Bankrupt player rolled: {msg}"
+    assert msg == "It's not your turn"
+
+    game.last_dice_roll = STANDARD_ROLL
+    game.phase = GamePhase.POST_ROLL
+    game.end_turn(first.id)
+    assert game.current_player is third, "Turn did not skip the bankrupt player"
+
+
+# =========== Ownership ===========
+
+@pytest.fixture(scope="class")
+def owned_game():
+    """The opponent owns the brown group (one house on 1); 6 is unowned."""
+    game = game_snapshot()
+    assign_properties(game, game.opponents[0], 3)
+    assign_properties(game, game.opponents[0], 1, houses=1)
+    return game
+
+
+class TestOwnershipRejections:
+    """Actions on property the current player doesn't own."""
+    
+    def test_operate_on_unowned_property(self, owned_game):
+        game, player = owned_game, owned_game.current_player
+        assert not game.build_house(player.id, 6)[0]
+        assert not game.mortgage_property(player.id, 6)[0]
+        assert not game.sell_building(player.id, 6)[0]
+        assert not game.unmortgage_property(player.id, 6)[0]
+        assert player.money == STARTING_MONEY
+    
+    def test_operate_on_other_players_property(self, owned_game):
+        game, player = owned_game, owned_game.current_player
+        assert not game.build_house(player.id, 3)[0]
+        assert not game.mortgage_property(player.id, 3)[0]
+        assert not game.sell_building(player.id, 1)[0]
+        assert game.board.get_property(1).houses == 1
+        assert player.money == STARTING_MONEY
+
+
+def test_remove_player_validation():
+    game = create_minimal_game(3)
+    player = game.current_player
+    ok, msg = game.remove_player("no-such-player")
+    assert not ok, f"Removed unknown player: {msg}"
+
+    other_id = next_player_id(game)
+    ok, msg = game.remove_player(other_id)
+    assert ok, msg
+    assert game.players[other_id].state == PlayerState.BANKRUPT
+    assert game.current_player is player